@@ -2,56 +2,88 @@ import pandas as pd
 import numpy as np
 import argparse
 import logging
+import math
 from datetime import datetime, timedelta
+from numba import njit
 
 from financial_math import black_scholes_greeks
 
-def generate_sample_options_data(days=365, symbol="NIFTY", initial_price=25000):
+@njit(cache=True, fastmath=True)
+def _gen_gbm_ohlc(n, S0, mu_dt, sig_sqrt_dt, z, u_hi, u_lo, out_close, out_open, out_high, out_low):
     """
-    Generates a realistic but simulated 1-minute options data CSV for backtesting.
+    Fills preallocated OHLC arrays with a GBM path in a single pass.
+
+    Each bar opens at the previous close (S0 for the first bar); high and low
+    extend the open/close range by the `u_hi`/`u_lo` noise.
+    """
+    logS = math.log(S0)
+    prev = S0
+    for i in range(n):
+        logS += mu_dt + sig_sqrt_dt * z[i]
+        c = math.exp(logS)
+        o = prev
+        out_close[i] = c
+        out_open[i] = o
+        out_high[i] = (c if c > o else o) + u_hi[i]
+        out_low[i] = (c if c < o else o) - u_lo[i]
+        prev = c
+
+def generate_sample_options_data(days=365, symbol="NIFTY", initial_price=25000, seed=None,
+                                 filepath="nifty_options_data.parquet"):
+    """
+    Generates a realistic but simulated 1-minute options data file (Parquet) for backtesting.
+    Pass `seed` to make the generated series reproducible.
     """
     logging.info(f"Generating {days} days of 1-minute sample data for {symbol}...")
     
     start_date = datetime.now() - timedelta(days=days)
     minutes = days * 24 * 60
-    timestamps = pd.to_datetime(pd.date_range(start=start_date, periods=minutes, freq='T'))
+    rng = np.random.default_rng(seed)
+    timestamps = pd.to_datetime(pd.date_range(start=start_date, periods=minutes, freq='min'))
     
-    # Simulate underlying price movement (Geometric Brownian Motion)
-    drift = 0.05 / (365 * 24 * 60) # 5% annual drift
-    volatility = 0.20 / np.sqrt(365 * 24 * 60) # 20% annual volatility
-    returns = np.exp(drift + volatility * np.random.randn(minutes))
-    underlying_prices = initial_price * returns.cumprod()
+    # Simulate underlying price movement (Geometric Brownian Motion) using the
+    # closed form S(t) = S0 * exp(sum((mu - sigma^2/2) dt + sigma sqrt(dt) Z)),
+    # together with OHLC bars, in one fused pass over preallocated buffers
+    dt = 1.0 / (365 * 24 * 60) # one-minute step in years
+    mu, sigma = 0.05, 0.20 # 5% annual drift, 20% annual volatility
+    mu_dt = (mu - 0.5 * sigma ** 2) * dt
+    sig_sqrt_dt = sigma * math.sqrt(dt)
+    z = rng.standard_normal(minutes, dtype=np.float32)
+    u_hi = rng.uniform(0, 5, minutes).astype(np.float32)
+    u_lo = rng.uniform(0, 5, minutes).astype(np.float32)
 
-    # Create a base DataFrame
-    df = pd.DataFrame({'timestamp': timestamps, 'underlying_price': underlying_prices})
-    df.set_index('timestamp', inplace=True)
-    df.rename(columns={'underlying_price': 'close'}, inplace=True)
-    
-    # Simulate OHLC
-    df['open'] = df['close'].shift(1)
-    df['high'] = df[['open', 'close']].max(axis=1) + np.random.uniform(0, 5, size=len(df))
-    df['low'] = df[['open', 'close']].min(axis=1) - np.random.uniform(0, 5, size=len(df))
-    df.dropna(inplace=True)
+    ohlc = {name: np.empty(minutes) for name in ('close', 'open', 'high', 'low')}
+    _gen_gbm_ohlc(minutes, float(initial_price), mu_dt, sig_sqrt_dt, z, u_hi, u_lo,
+                  ohlc['close'], ohlc['open'], ohlc['high'], ohlc['low'])
+    df = pd.DataFrame(ohlc, index=pd.Index(timestamps, name='timestamp'), copy=False)
     
     # For simplicity in this example, we won't generate a full options chain.
     # The backtester will use this underlying price data and a strategy
     # that dynamically calculates option prices. For a more advanced simulation,
     # you would generate data for multiple strikes and expiries.
     
-    filepath = "nifty_options_data.csv"
-    df.to_csv(filepath)
+    df.to_parquet(filepath, engine="pyarrow", compression="snappy")
     logging.info(f"Sample data saved to {filepath}")
     return df
 
 def load_historical_data(filepath):
-    """Loads historical data from a CSV file into a pandas DataFrame."""
+    """
+    Loads historical data from a Parquet file (or a legacy CSV file) into a
+    pandas DataFrame.
+    """
     try:
         logging.info(f"Loading historical data from {filepath}...")
-        df = pd.read_csv(filepath, index_col='timestamp', parse_dates=True)
-        # Ensure standard column names for backtrader
-        df.rename(columns={'close': 'close', 'open': 'open', 'high': 'high', 'low': 'low'}, inplace=True)
-        df['volume'] = 0  # Add dummy volume if not present
-        df['openinterest'] = 0 # Add dummy open interest
+        if str(filepath).endswith('.parquet'):
+            df = pd.read_parquet(filepath)
+        else:
+            # Pre-typed columns let pandas' C parser skip dtype inference
+            df = pd.read_csv(filepath, index_col='timestamp', parse_dates=['timestamp'],
+                             usecols=['timestamp', 'open', 'high', 'low', 'close'],
+                             dtype={'open': np.float32, 'high': np.float32,
+                                    'low': np.float32, 'close': np.float32},
+                             engine='c')
+        df['volume'] = np.zeros(len(df), dtype=np.int32)  # Add dummy volume if not present
+        df['openinterest'] = np.zeros(len(df), dtype=np.int32) # Add dummy open interest
         return df
     except FileNotFoundError:
         logging.error(f"Data file not found at {filepath}. Please generate it first.")
@@ -60,8 +92,10 @@ def load_historical_data(filepath):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Data Fetcher Utility")
     parser.add_argument('--generate-sample-data', action='store_true',
-                        help="Generate a sample CSV file with NIFTY options data.")
+                        help="Generate a sample Parquet file with NIFTY options data.")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Random seed for reproducible sample data.")
     args = parser.parse_args()
     
     if args.generate_sample_data:
-        generate_sample_options_data()
+        generate_sample_options_data(seed=args.seed)
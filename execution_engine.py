@@ -1,8 +1,16 @@
 import asyncio
 import logging
 import base64
+import signal
 from kiteconnect import KiteConnect, KiteTicker
 
+# Decoded API secrets, keyed by their base64 encoding
+_secret_cache = {}
+# KiteConnect clients, keyed by (api_key, access_token), so that re-creating a
+# trader reuses the existing HTTP session. Tickers are not cached: each trader
+# owns its WebSocket and closes it on shutdown.
+_client_cache = {}
+
 class BaseTrader:
     """Base class for paper and live trading engines."""
     def __init__(self, config, strategy, symbol, dry_run=False):
@@ -13,26 +21,87 @@ class BaseTrader:
         self.dry_run = dry_run
         
         api_key = self.api_config['api_key']
+        access_token = self.api_config['access_token']
         # For production, use a secure vault. This is a placeholder.
-        api_secret = base64.b64decode(self.api_config['api_secret_base64_encoded']).decode('utf-8')
+        encoded_secret = self.api_config['api_secret_base64_encoded']
+        if encoded_secret not in _secret_cache:
+            _secret_cache[encoded_secret] = base64.b64decode(encoded_secret).decode('utf-8')
+        api_secret = _secret_cache[encoded_secret]
         
-        self.kite = KiteConnect(api_key=api_key)
-        self.kite.set_access_token(self.api_config['access_token'])
+        client_key = (api_key, access_token)
+        if client_key not in _client_cache:
+            kite = KiteConnect(api_key=api_key)
+            kite.set_access_token(access_token)
+            _client_cache[client_key] = kite
+        self.kite = _client_cache[client_key]
         
-        self.kws = KiteTicker(api_key, self.api_config['access_token'])
+        self.kws = KiteTicker(api_key, access_token)
         self.kws.on_ticks = self.on_ticks
         self.kws.on_connect = self.on_connect
         
+        self._stop = asyncio.Event()
+        # Ticks arrive on the ticker's thread and are handed to the event loop
+        # through a bounded queue, so strategy logic never blocks the reader.
+        self._loop = None
+        self._queue = asyncio.Queue(maxsize=10_000)
+        
         logging.info(f"Trader initialized for {symbol} with strategy {strategy}. Dry run: {self.dry_run}")
         
     async def start(self):
         logging.info("Starting trader...")
+        loop = self._loop = asyncio.get_running_loop()
+        handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._request_stop)
+                handled_signals.append(sig)
+            except NotImplementedError:
+                pass # Not supported on Windows; KeyboardInterrupt still applies
+        consumer = asyncio.create_task(self._consume())
         self.kws.connect(threaded=True)
-        # Keep the main thread alive
-        while True:
-            await asyncio.sleep(1)
+        # Keep the main thread alive without waking up until asked to stop
+        await self._stop.wait()
+        consumer.cancel()
+        try:
+            await consumer
+        except asyncio.CancelledError:
+            pass
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+        logging.info("Trader stopped.")
+
+    async def shutdown(self):
+        """Closes the WebSocket connection and lets `start` return."""
+        self._request_stop()
+
+    def _request_stop(self):
+        # Shared by shutdown() and the SIGINT/SIGTERM handlers
+        logging.info("Shutting down trader...")
+        self.kws.close()
+        self._stop.set()
 
     def on_ticks(self, ws, ticks):
+        # Called on the ticker's thread; hand off to the event loop
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._try_put, ticks)
+
+    def _try_put(self, ticks):
+        try:
+            self._queue.put_nowait(ticks)
+        except asyncio.QueueFull:
+            logging.warning(f"Tick queue full. Dropping {len(ticks)} ticks.")
+
+    async def _consume(self):
+        while True:
+            ticks = await self._queue.get()
+            try:
+                self.process_ticks(ticks)
+            except Exception as e:
+                logging.error(f"Tick processing failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    def process_ticks(self, ticks):
         logging.debug(f"Ticks received: {ticks}")
         # Strategy logic would be implemented here, processing ticks
         # and making trade decisions.
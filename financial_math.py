@@ -1,11 +1,17 @@
+import math
 import numpy as np
-from scipy.stats import norm
+from scipy.special import ndtr
 
-# Note: The user prompt allowed standard libraries like scipy.stats, which is part
-# of the scipy package often installed with numpy and pandas. If scipy is strictly
-# forbidden, the norm.cdf can be approximated with the error function (math.erf).
-# For this implementation, we assume `scipy.stats.norm` is available as it's a
-# scientific computing standard.
+# Note: The standard normal CDF comes from `scipy.special.ndtr`, the raw ufunc
+# behind `scipy.stats.norm.cdf`. Calling it directly skips the distribution
+# object's argument validation and broadcasting, which dominates the cost of
+# a scalar call. The PDF has a simple closed form, so it is computed inline.
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+
+def _norm_pdf(x):
+    """Standard normal probability density function."""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
 
 def black_scholes_greeks(S, K, T, r, sigma, option_type='call'):
     """
@@ -30,24 +36,28 @@ def black_scholes_greeks(S, K, T, r, sigma, option_type='call'):
             price = max(0, K - S)
         return {'price': price, 'delta': 1 if S > K else 0, 'gamma': 0, 'theta': 0, 'vega': 0, 'rho': 0}
 
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-
-    if option_type == 'call':
-        price = (S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2))
-        delta = norm.cdf(d1)
-        rho = K * T * np.exp(-r * T) * norm.cdf(d2)
-    elif option_type == 'put':
-        price = (K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1))
-        delta = -norm.cdf(-d1)
-        rho = -K * T * np.exp(-r * T) * norm.cdf(-d2)
-    else:
+    # Scalar inputs go through the `math` module rather than NumPy ufuncs,
+    # which would box and unbox every value; arrays use black_scholes_greeks_vec.
+    sqrtT = math.sqrt(T)
+    disc = math.exp(-r * T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+
+    if option_type not in ('call', 'put'):
         raise ValueError("Invalid option type. Must be 'call' or 'put'.")
 
-    gamma = norm.pdf(d1) / (S * sigma * np.sqrt(T))
-    vega = S * norm.pdf(d1) * np.sqrt(T) / 100 # Vega is per 1% change in vol
-    theta = (- (S * norm.pdf(d1) * sigma) / (2 * np.sqrt(T)) -
-             r * K * np.exp(-r * T) * (norm.cdf(d2) if option_type == 'call' else norm.cdf(-d2))) / 365 # per day
+    # Calls and puts share one formula with a sign flip: phi = +1 / -1
+    phi = 1.0 if option_type == 'call' else -1.0
+    Nphid1 = ndtr(phi * d1)
+    Nphid2 = ndtr(phi * d2)
+    price = phi * (S * Nphid1 - K * disc * Nphid2)
+    delta = phi * Nphid1
+    rho = phi * K * T * disc * Nphid2
+
+    pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+    gamma = pdf_d1 / (S * sigma * sqrtT)
+    vega = S * pdf_d1 * sqrtT / 100 # Vega is per 1% change in vol
+    theta = (- (S * pdf_d1 * sigma) / (2 * sqrtT) - phi * r * K * disc * Nphid2) / 365 # per day
 
     return {
         'price': price,
@@ -58,24 +68,168 @@ def black_scholes_greeks(S, K, T, r, sigma, option_type='call'):
         'rho': rho,
     }
 
+def black_scholes_greeks_vec(S, K, T, r, sigma, is_call_mask):
+    """
+    Calculates Black-Scholes prices and Greeks for arrays of European options.
+
+    All inputs are broadcast against each other, so a whole chain of strikes
+    and expiries is priced in a single pass of NumPy ufuncs.
+
+    Args:
+        S (array_like): Current underlying prices
+        K (array_like): Option strike prices
+        T (array_like): Times to expiration in years
+        r (array_like): Risk-free interest rates (annual)
+        sigma (array_like): Volatilities of the underlying asset (annual)
+        is_call_mask (array_like): True for calls, False for puts
+
+    Returns:
+        dict: Arrays of price, delta, gamma, theta, vega and rho, one element per option.
+    """
+    S, K, T, r, sigma, is_call = np.broadcast_arrays(
+        np.asarray(S, dtype=np.float64),
+        np.asarray(K, dtype=np.float64),
+        np.asarray(T, dtype=np.float64),
+        np.asarray(r, dtype=np.float64),
+        np.asarray(sigma, dtype=np.float64),
+        np.asarray(is_call_mask, dtype=bool),
+    )
+
+    # Expired or invalid options get placeholder inputs so the formulas below
+    # stay finite; their results are replaced by intrinsic values at the end.
+    valid = (T > 0) & (sigma > 0)
+    T = np.where(valid, T, 1.0)
+    sigma = np.where(valid, sigma, 1.0)
+
+    sqrtT = np.sqrt(T)
+    disc = np.exp(-r * T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+
+    # Same sign-flipped formula as black_scholes_greeks, with phi as an array
+    phi = np.where(is_call, 1.0, -1.0)
+    Nphid1 = ndtr(phi * d1)
+    Nphid2 = ndtr(phi * d2)
+    pdf_d1 = _norm_pdf(d1)
+
+    price = phi * (S * Nphid1 - K * disc * Nphid2)
+    delta = phi * Nphid1
+    rho = phi * K * T * disc * Nphid2
+
+    gamma = pdf_d1 / (S * sigma * sqrtT)
+    vega = S * pdf_d1 * sqrtT / 100 # Vega is per 1% change in vol
+    theta = (- (S * pdf_d1 * sigma) / (2 * sqrtT) - phi * r * K * disc * Nphid2) / 365 # per day
+
+    intrinsic = np.where(is_call, np.maximum(S - K, 0), np.maximum(K - S, 0))
+    return {
+        'price': np.where(valid, price, intrinsic),
+        'delta': np.where(valid, delta, (S > K).astype(np.float64)),
+        'gamma': np.where(valid, gamma, 0.0),
+        'theta': np.where(valid, theta, 0.0),
+        'vega': np.where(valid, vega, 0.0),
+        'rho': np.where(valid, rho, 0.0),
+    }
+
+def precompute_atm_table(T_days_range, sigma_buckets, r):
+    """
+    Precomputes the at-the-money Black-Scholes terms over a grid of expiries
+    and volatilities.
+
+    With S = K the log-moneyness term drops out of d1, so d1 and d2 depend only
+    on T, r and sigma and can be looked up instead of recomputed on every bar.
+
+    Args:
+        T_days_range (array_like): Times to expiration in days (table rows)
+        sigma_buckets (array_like): Volatilities (table columns)
+        r (float): Risk-free interest rate (annual)
+
+    Returns:
+        np.ndarray: float32 array of shape (len(T_days_range), len(sigma_buckets), 5)
+        holding d1, d2, N(d1), N(d2) and pdf(d1) along the last axis.
+    """
+    T = np.asarray(T_days_range, dtype=np.float64)[:, None] / 365
+    sigma = np.asarray(sigma_buckets, dtype=np.float64)[None, :]
+    sqrtT = np.sqrt(T)
+    d1 = (r + 0.5 * sigma ** 2) * T / (sigma * sqrtT)
+    d2 = d1 - sigma * sqrtT
+    return np.stack([d1, d2, ndtr(d1), ndtr(d2), _norm_pdf(d1)], axis=-1).astype(np.float32)
+
+def _bs_price_vega(S, K, T, sigma, phi, log_SK, rT, sqrtT, disc):
+    """
+    Black-Scholes price and raw vega (per unit of vol) for arrays of options.
+
+    A trimmed-down `black_scholes_greeks_vec` for the implied volatility solver,
+    which only needs these two quantities on every iteration. The terms that
+    don't depend on sigma (log(S/K), rT, sqrt(T), exp(-rT)) are passed in
+    precomputed, since they stay fixed while the solver iterates.
+    """
+    sig_sqrtT = sigma * sqrtT
+    d1 = (log_SK + rT + 0.5 * sigma * sigma * T) / sig_sqrtT
+    d2 = d1 - sig_sqrtT
+    price = phi * (S * ndtr(phi * d1) - K * disc * ndtr(phi * d2))
+    vega = S * _norm_pdf(d1) * sqrtT
+    return price, vega
+
 def implied_volatility(market_price, S, K, T, r, option_type='call', max_iter=100, tol=1e-5):
     """
     Calculates the implied volatility using the Newton-Raphson method.
+
+    Accepts scalars or arrays (e.g. a whole option chain); array inputs are
+    solved in lock-step, with converged elements masked out of later
+    iterations. `option_type` may be 'call', 'put', an array of those strings,
+    or a boolean call mask.
+    Elements that fail to converge are returned as NaN.
     """
-    sigma = 0.2  # Initial guess for volatility
-    for i in range(max_iter):
-        greeks = black_scholes_greeks(S, K, T, r, sigma, option_type)
-        price = greeks['price']
-        vega = greeks['vega'] * 100 # Adjust vega back to its raw value
+    option_type = np.asarray(option_type)
+    if option_type.dtype.kind in 'US':
+        option_type = option_type.astype(str)
+        if not np.isin(option_type, ('call', 'put')).all():
+            raise ValueError("Invalid option type. Must be 'call' or 'put'.")
+        option_type = option_type == 'call'
+    elif option_type.dtype != bool:
+        raise ValueError("Invalid option type. Must be 'call', 'put' or a boolean call mask.")
+
+    market_price, S, K, T, r, is_call = np.broadcast_arrays(
+        np.asarray(market_price, dtype=np.float64),
+        np.asarray(S, dtype=np.float64),
+        np.asarray(K, dtype=np.float64),
+        np.asarray(T, dtype=np.float64),
+        np.asarray(r, dtype=np.float64),
+        np.asarray(option_type, dtype=bool),
+    )
+    scalar_input = market_price.ndim == 0
+    market_price, S, K, T, r, is_call = (np.atleast_1d(a) for a in (market_price, S, K, T, r, is_call))
 
-        if vega < 1e-6:
-            return np.nan # Avoid division by zero
+    # Loop invariants: only sigma changes between iterations
+    phi = np.where(is_call, 1.0, -1.0)
+    log_SK = np.log(S / K)
+    rT = r * T
+    sqrtT = np.sqrt(np.maximum(T, 0.0))
+    disc = np.exp(-rT)
 
-        diff = price - market_price
-        if abs(diff) < tol:
-            return sigma
+    # Initial guess from Jaeckel's "Let's Be Rational": the vol that maximises
+    # vega for this moneyness, floored so at-the-forward options still move.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = np.sqrt(2 * np.abs(log_SK + rT) / T)
+    sigma = np.where(np.isfinite(sigma), np.maximum(sigma, 0.05), 0.2)
+
+    converged = np.zeros(sigma.shape, dtype=bool)
+    active = T > 0
+    for i in range(max_iter):
+        if not active.any():
+            break
+        idx = np.flatnonzero(active)
+        price, vega = _bs_price_vega(S[idx], K[idx], T[idx], sigma[idx], phi[idx],
+                                     log_SK[idx], rT[idx], sqrtT[idx], disc[idx])
+        diff = price - market_price[idx]
 
-        sigma = sigma - diff / vega
+        done = np.abs(diff) < tol
+        stalled = ~done & ~(vega >= 1e-6) # Avoid division by zero (and NaN vega)
+        update = ~(done | stalled)
 
-    return sigma if abs(diff) < tol else np.nan # Return NaN if not converged
+        converged[idx[done]] = True
+        active[idx[~update]] = False
+        sigma[idx[update]] -= diff[update] / vega[update]
 
+    result = np.where(converged, sigma, np.nan) # Return NaN if not converged
+    return float(result[0]) if scalar_input else result
@@ -22,13 +22,31 @@ class RiskManager:
         """
         if confidence_level is None:
             confidence_level = self.risk_config['var_confidence_level']
+        if not 0 <= confidence_level <= 1:
+            raise ValueError("Confidence level must be between 0 and 1.")
             
         if len(historical_returns) < 50:
             logging.warning("Not enough historical data to calculate VaR accurately.")
             return 0
         
-        # VaR is the percentile of the historical returns
-        var = np.percentile(historical_returns, 100 * (1 - confidence_level))
+        # VaR is the percentile of the historical returns. Select the two order
+        # statistics around it with an O(n) partition instead of a full sort,
+        # then interpolate linearly. The index and interpolation follow
+        # np.percentile's arithmetic step for step, so results match it exactly.
+        returns = np.ascontiguousarray(historical_returns, dtype=np.float64)
+        if np.isnan(returns).any():
+            # np.partition sorts NaNs to the end, which would hide missing data
+            logging.warning("Historical returns contain NaN values. VaR is undefined.")
+            return np.nan
+        n = len(returns)
+        quantile = (100 * (1 - confidence_level)) / 100
+        h = (n - 1) * quantile
+        lo = int(np.floor(h))
+        hi = min(lo + 1, n - 1)
+        part = np.partition(returns, (lo, hi))
+        t = h - lo
+        diff = part[hi] - part[lo]
+        var = part[hi] - diff * (1 - t) if t >= 0.5 else part[lo] + diff * t
         logging.info(f"Calculated VaR at {confidence_level*100}% confidence: {var:.2f}%")
         return abs(var)
 
@@ -1,12 +1,60 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
 import backtrader as bt
 import backtrader.indicators as btind
-from financial_math import black_scholes_greeks
+from financial_math import black_scholes_greeks, black_scholes_greeks_vec, precompute_atm_table
+
+def wilder_rsi(close, period=14):
+    """
+    Computes Wilder's RSI over a whole price series in one vectorized pass.
+
+    Matches `backtrader.indicators.RelativeStrengthIndex`: gains and losses are
+    smoothed with an exponential average of alpha 1/period, seeded with the
+    simple mean of the first `period` changes. The first `period` values are NaN.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    rsi = np.full(len(close), np.nan)
+    if len(close) <= period:
+        return rsi
+
+    diff = np.diff(close)
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+
+    def smooth(x):
+        seeded = np.concatenate([[x[:period].mean()], x[period:]])
+        return pd.Series(seeded).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+
+    avg_up = smooth(up)
+    avg_down = smooth(down)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi[period:] = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+    return rsi
+
+@dataclass
+class LegsSoA:
+    """
+    Struct-of-arrays layout for the legs of a multi-leg options position.
+
+    Each field holds one element per leg, so the whole position can be priced
+    with a single call to `black_scholes_greeks_vec`.
+    """
+    strikes: np.ndarray # float64
+    is_call: np.ndarray # bool
+    qty: np.ndarray # int32, positive for long legs, negative for short legs
 
 class BaseStrategy(bt.Strategy):
     """Base class for all options strategies."""
     params = (
         ('symbol_config', None),
         ('risk_config', None),
+        # Assumptions used to price simulated option legs
+        ('days_to_expiry', 7),
+        ('risk_free_rate', 0.07),
+        ('volatility', 0.15),
     )
     
     def log(self, txt, dt=None):
@@ -18,6 +66,11 @@ class BaseStrategy(bt.Strategy):
         self.lot_size = self.p.symbol_config['lot_size']
         self.risk_params = self.p.risk_config
         self.order = None
+        # Pre-bound references for the per-bar hot path in next()
+        self._close = self.underlying.close
+        self._buy = self.buy
+        self._sell = self.sell
+        self._log = self.log
 
     def notify_order(self, order):
         if order.status in [order.Submitted, order.Accepted]:
@@ -33,58 +86,154 @@ class StraddleStrategy(BaseStrategy):
     A simple long straddle strategy. Enters a straddle on the first bar.
     This is for demonstration; a real strategy would have better entry logic.
     """
+    # Max |log(S/K)| / (sigma * sqrt(T)), i.e. moneyness in standard deviations,
+    # priced from the ATM table
+    params = (('atm_tolerance', 0.1),)
+
+    # Grid for the precomputed ATM table: expiries in days, volatility buckets
+    atm_T_days = np.arange(1, 366)
+    atm_sigma_buckets = np.round(np.arange(0.01, 1.0, 0.01), 2)
+
+    def __init__(self):
+        super().__init__()
+        self.atm_table = precompute_atm_table(self.atm_T_days, self.atm_sigma_buckets, self.p.risk_free_rate)
+
+    def straddle_quote(self, S, K):
+        """Returns the (call, put, delta) of a straddle at strike K."""
+        T_days = self.p.days_to_expiry
+        r = self.p.risk_free_rate
+        sigma = self.p.volatility
+
+        # The table only covers whole-day expiries and vols within half a bucket
+        # of a grid value; anything else, or a strike too far from the money,
+        # goes through the full pricer.
+        ti = int(T_days) - self.atm_T_days[0]
+        si = int(np.abs(self.atm_sigma_buckets - sigma).argmin())
+        bucket_width = self.atm_sigma_buckets[1] - self.atm_sigma_buckets[0]
+        on_grid = (T_days == int(T_days) and 0 <= ti < len(self.atm_T_days)
+                   and abs(self.atm_sigma_buckets[si] - sigma) <= bucket_width / 2)
+
+        if not on_grid or abs(math.log(S / K)) > self.p.atm_tolerance * sigma * math.sqrt(T_days / 365):
+            greeks = black_scholes_greeks_vec(S, K, T_days / 365, r, sigma, [True, False])
+            call, put = greeks['price']
+            return call, put, greeks['delta'].sum()
+
+        # The table holds the terms of an option struck at S = K. Expand the
+        # call around that point to third order in S - K using its delta,
+        # gamma and speed; the put follows from put-call parity.
+        d1, _, Nd1, Nd2, pdf_d1 = self.atm_table[ti, si].astype(np.float64)
+        T = T_days / 365
+        sig_sqrtT = self.atm_sigma_buckets[si] * math.sqrt(T)
+        disc = math.exp(-r * T)
+        gamma = pdf_d1 / (K * sig_sqrtT)
+        speed = -gamma / K * (1 + d1 / sig_sqrtT)
+        dS = S - K
+
+        call = K * (Nd1 - disc * Nd2) + Nd1 * dS + gamma * dS ** 2 / 2 + speed * dS ** 3 / 6
+        put = call - S + K * disc # Put-call parity
+        call_delta = Nd1 + gamma * dS + speed * dS ** 2 / 2
+        return call, put, 2 * call_delta - 1
+
     def next(self):
         if self.position:
             return # Only enter once
 
         # Find ATM strike
-        atm_strike = round(self.underlying.close[0] / 100) * 100
+        price = self._close[0]
+        atm_strike = round(price / 100) * 100
         
         # For backtesting, we simulate option prices. A real implementation
         # would fetch live option data.
-        self.log(f"Entering Long Straddle at ATM strike: {atm_strike}")
+        call, put, delta = self.straddle_quote(price, atm_strike)
+        self._log(f"Entering Long Straddle at ATM strike: {atm_strike} "
+                 f"(Call: {call:.2f}, Put: {put:.2f}, Delta: {delta:.2f})")
         
         # Simulate buying a call and a put
         # In backtrader, you'd typically have separate data feeds for each option
         # Here we just simulate the buy orders for accounting.
-        self.buy(size=self.lot_size) # Represents the call
-        self.buy(size=self.lot_size) # Represents the put
-        self.log(f'BUY EXECUTED for Straddle, Price: {self.underlying.close[0]:.2f}, Size: {self.lot_size * 2}')
+        self._buy(size=self.lot_size) # Represents the call
+        self._buy(size=self.lot_size) # Represents the put
+        self._log(f'BUY EXECUTED for Straddle, Price: {price:.2f}, Size: {self.lot_size * 2}')
 
 class IronCondorStrategy(BaseStrategy):
     """Sells an Iron Condor, assuming a range-bound market."""
+    # Legs: sell put, buy put, sell call, buy call
+    leg_ratios = np.array([0.98, 0.97, 1.02, 1.03])
+    leg_is_call = np.array([False, False, True, True])
+    leg_sides = np.array([-1, 1, -1, 1], dtype=np.int32)
+    strike_step = 50
+
+    def __init__(self):
+        super().__init__()
+        # Per-leg constants, so strikes come from one vectorized expression:
+        # np.round(price * leg_ratios / steps) * steps
+        self._ic_steps = np.full(len(self.leg_ratios), self.strike_step, dtype=np.float64)
+        self._ic_qty = self.leg_sides * self.lot_size
+        self._ic_T = self.p.days_to_expiry / 365
+
+    def condor_quote(self, price):
+        """Returns the (legs, net_credit, net_delta) of an Iron Condor around price."""
+        steps = self._ic_steps
+        legs = LegsSoA(
+            strikes=np.round(price * self.leg_ratios / steps) * steps,
+            is_call=self.leg_is_call,
+            qty=self._ic_qty,
+        )
+        greeks = black_scholes_greeks_vec(price, legs.strikes, self._ic_T,
+                                          self.p.risk_free_rate, self.p.volatility, legs.is_call)
+        net_credit = -np.dot(legs.qty, greeks['price'])
+        net_delta = np.dot(legs.qty, greeks['delta'])
+        return legs, net_credit, net_delta
+
     def next(self):
         if self.position:
             return
         
-        price = self.underlying.close[0]
-        # Example logic: Sell 200 points OTM call/put, buy 300 points OTM
-        sell_put_strike = round((price * 0.98) / 50) * 50
-        buy_put_strike = round((price * 0.97) / 50) * 50
-        sell_call_strike = round((price * 1.02) / 50) * 50
-        buy_call_strike = round((price * 1.03) / 50) * 50
-
-        self.log(f"Entering Iron Condor: Sell {sell_put_strike}P & {sell_call_strike}C, Buy {buy_put_strike}P & {buy_call_strike}C")
+        # Example logic: Sell 2% OTM call/put, buy 3% OTM
+        legs, net_credit, net_delta = self.condor_quote(self._close[0])
+
+        sell_put_strike, buy_put_strike, sell_call_strike, buy_call_strike = legs.strikes
+        self._log(f"Entering Iron Condor: Sell {sell_put_strike:.0f}P & {sell_call_strike:.0f}C, "
+                 f"Buy {buy_put_strike:.0f}P & {buy_call_strike:.0f}C "
+                 f"(Net credit: {net_credit:.2f}, Net delta: {net_delta:.2f})")
         # In a real scenario, each leg is a separate order
-        self.sell(size=self.lot_size) # Net credit strategy
+        self._sell(size=self.lot_size) # Net credit strategy
         
 class RSIMomentumStrategy(BaseStrategy):
     """A directional strategy using RSI."""
-    params = (('rsi_period', 14), ('rsi_overbought', 70), ('rsi_oversold', 30))
+    params = (
+        ('rsi_period', 14),
+        ('rsi_overbought', 70),
+        ('rsi_oversold', 30),
+        ('precompute_rsi', True), # Compute RSI once over the preloaded series
+    )
 
     def __init__(self):
         super().__init__()
-        self.rsi = btind.RelativeStrengthIndex(period=self.p.rsi_period)
+        self._rsi_arr = None
+        # Precomputing needs the whole series up front, which is only the case
+        # when cerebro preloads the data; otherwise use the line indicator.
+        if self.p.precompute_rsi and self.underlying.buflen() > 0:
+            self._rsi_arr = wilder_rsi(self.underlying.close.array, self.p.rsi_period)
+        else:
+            self.rsi = btind.RelativeStrengthIndex(period=self.p.rsi_period)
 
     def next(self):
         if self.order:
             return
 
+        if self._rsi_arr is not None:
+            rsi = self._rsi_arr[len(self.underlying) - 1]
+            if np.isnan(rsi):
+                return # Still in the RSI warm-up period
+        else:
+            rsi = self.rsi[0]
+
         if not self.position:
-            if self.rsi < self.p.rsi_oversold:
-                self.log(f'RSI oversold ({self.rsi[0]:.2f}). Buying Call Option.')
-                self.order = self.buy(size=self.lot_size)
+            if rsi < self.p.rsi_oversold:
+                self._log(f'RSI oversold ({rsi:.2f}). Buying Call Option.')
+                self.order = self._buy(size=self.lot_size)
         else:
-            if self.rsi > self.p.rsi_overbought:
-                self.log(f'RSI overbought ({self.rsi[0]:.2f}). Closing position.')
+            if rsi > self.p.rsi_overbought:
+                self._log(f'RSI overbought ({rsi:.2f}). Closing position.')
                 self.order = self.close()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from data_fetcher import generate_sample_options_data, load_historical_data
+
+class TestDataFetcher(unittest.TestCase):
+
+    def setUp(self):
+        """Generate two days of sample data into a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.parquet_path = os.path.join(self.tmpdir.name, 'sample.parquet')
+        self.initial_price = 25000
+        self.df = generate_sample_options_data(days=2, initial_price=self.initial_price, seed=42,
+                                               filepath=self.parquet_path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_ohlc_consistency(self):
+        """Test that every bar's high/low bound its open and close."""
+        df = self.df
+        self.assertEqual(len(df), 2 * 24 * 60)
+        self.assertFalse(df.isna().any().any())
+        self.assertTrue((df['high'] >= np.maximum(df['open'], df['close'])).all())
+        self.assertTrue((df['low'] <= np.minimum(df['open'], df['close'])).all())
+        # Each bar opens at the previous close, the first one at the initial price
+        self.assertEqual(df['open'].iloc[0], self.initial_price)
+        np.testing.assert_array_equal(df['open'].to_numpy()[1:], df['close'].to_numpy()[:-1])
+
+    def test_seed_reproducibility(self):
+        """Test that a seed reproduces the same prices and a different seed doesn't."""
+        other_path = os.path.join(self.tmpdir.name, 'other.parquet')
+        same = generate_sample_options_data(days=2, initial_price=self.initial_price, seed=42, filepath=other_path)
+        different = generate_sample_options_data(days=2, initial_price=self.initial_price, seed=7, filepath=other_path)
+        np.testing.assert_array_equal(same.to_numpy(), self.df.to_numpy())
+        self.assertFalse(np.array_equal(different.to_numpy(), self.df.to_numpy()))
+
+    def test_parquet_round_trip(self):
+        """Test that the generated Parquet file loads back unchanged."""
+        loaded = load_historical_data(self.parquet_path)
+        np.testing.assert_array_equal(loaded.index, self.df.index)
+        for column in ('open', 'high', 'low', 'close'):
+            np.testing.assert_array_equal(loaded[column].to_numpy(), self.df[column].to_numpy())
+        for column in ('volume', 'openinterest'):
+            self.assertEqual(loaded[column].dtype, np.int32)
+            self.assertFalse(loaded[column].any())
+
+    def test_csv_round_trip(self):
+        """Test that legacy CSV files load with the expected columns and dtypes."""
+        csv_path = os.path.join(self.tmpdir.name, 'sample.csv')
+        self.df.to_csv(csv_path)
+        loaded = load_historical_data(csv_path)
+        np.testing.assert_array_equal(loaded.index, self.df.index)
+        for column in ('open', 'high', 'low', 'close'):
+            self.assertEqual(loaded[column].dtype, np.float32)
+            np.testing.assert_allclose(loaded[column].to_numpy(), self.df[column].to_numpy(), rtol=1e-6)
+        self.assertEqual(loaded['volume'].dtype, np.int32)
+
+if __name__ == '__main__':
+    unittest.main()
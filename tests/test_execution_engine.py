@@ -0,0 +1,79 @@
+import asyncio
+import sys
+import threading
+import types
+import unittest
+from unittest import mock
+
+class StubKiteConnect:
+    def __init__(self, api_key):
+        self.api_key = api_key
+
+    def set_access_token(self, access_token):
+        self.access_token = access_token
+
+class StubKiteTicker:
+    """Delivers `ticks_to_send` from a background thread, like KiteTicker does."""
+    ticks_to_send = [[{'instrument_token': 256265, 'last_price': 25000.0}]]
+
+    def __init__(self, api_key, access_token):
+        self.closed = False
+
+    def connect(self, threaded=False):
+        def deliver():
+            for ticks in self.ticks_to_send:
+                self.on_ticks(self, ticks)
+        threading.Thread(target=deliver).start()
+
+    def close(self):
+        self.closed = True
+
+stub_kiteconnect = types.ModuleType('kiteconnect')
+stub_kiteconnect.KiteConnect = StubKiteConnect
+stub_kiteconnect.KiteTicker = StubKiteTicker
+with mock.patch.dict(sys.modules, {'kiteconnect': stub_kiteconnect}):
+    from execution_engine import BaseTrader
+
+CONFIG = {'api': {'api_key': 'key', 'access_token': 'token', 'api_secret_base64_encoded': 'c2VjcmV0'}}
+
+class RecordingTrader(BaseTrader):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.received = []
+        self.got_ticks = asyncio.Event()
+
+    def process_ticks(self, ticks):
+        self.received.append(ticks)
+        self.got_ticks.set()
+
+class TestBaseTrader(unittest.IsolatedAsyncioTestCase):
+
+    async def test_ticks_reach_process_ticks_and_shutdown_stops(self):
+        """Test that ticks from the ticker thread are processed and shutdown() ends start()."""
+        trader = RecordingTrader(CONFIG, 'straddle', 'NIFTY', dry_run=True)
+        task = asyncio.create_task(trader.start())
+        await asyncio.wait_for(trader.got_ticks.wait(), timeout=5)
+        self.assertEqual(trader.received, StubKiteTicker.ticks_to_send)
+
+        await trader.shutdown()
+        await asyncio.wait_for(task, timeout=5)
+        self.assertTrue(trader.kws.closed)
+
+    async def test_full_queue_drops_ticks(self):
+        """Test that ticks are dropped with a warning once the queue is full."""
+        trader = RecordingTrader(CONFIG, 'straddle', 'NIFTY', dry_run=True)
+        trader._loop = asyncio.get_running_loop()
+        trader._queue = asyncio.Queue(maxsize=2)
+
+        with self.assertLogs(level='WARNING') as logs:
+            sender = threading.Thread(target=lambda: [trader.on_ticks(None, [{'n': i}]) for i in range(3)])
+            sender.start()
+            sender.join()
+            for _ in range(10):
+                await asyncio.sleep(0) # Let the scheduled puts run
+        self.assertEqual(trader._queue.qsize(), 2)
+        self.assertEqual([trader._queue.get_nowait() for _ in range(2)], [[{'n': 0}], [{'n': 1}]])
+        self.assertIn('Tick queue full', logs.output[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
 import numpy as np
 
-from financial_math import black_scholes_greeks, implied_volatility
+from financial_math import black_scholes_greeks, black_scholes_greeks_vec, implied_volatility, precompute_atm_table
+from financial_math_nb import bs_greeks_nb, bs_greeks_nb_batch
 
 class TestFinancialMath(unittest.TestCase):
 
@@ -29,6 +30,7 @@ class TestFinancialMath(unittest.TestCase):
         # Expected values from a known BS calculator
         self.assertAlmostEqual(greeks['price'], 5.57, delta=0.01)
         self.assertAlmostEqual(greeks['delta'], -0.363, delta=0.001)
+        self.assertAlmostEqual(greeks['theta'], -0.0045, delta=0.0001) # theta per day
 
     def test_implied_volatility(self):
         """Test the implied volatility solver."""
@@ -36,6 +38,25 @@ class TestFinancialMath(unittest.TestCase):
         iv = implied_volatility(market_price, self.S, self.K, self.T, self.r, 'call')
         self.assertAlmostEqual(iv, self.sigma, delta=1e-4)
 
+    def test_implied_volatility_chain(self):
+        """Test that the solver recovers the volatility across a whole chain."""
+        strikes = np.linspace(80, 120, 9)
+        is_call = strikes >= self.S
+        prices = black_scholes_greeks_vec(self.S, strikes, self.T, self.r, self.sigma, is_call)['price']
+        ivs = implied_volatility(prices, self.S, strikes, self.T, self.r, is_call)
+        np.testing.assert_allclose(ivs, self.sigma, atol=1e-4)
+
+    def test_implied_volatility_option_types(self):
+        """Test that string arrays are mapped per element and bad types are rejected."""
+        call = black_scholes_greeks(self.S, self.K, self.T, self.r, 0.25, 'call')['price']
+        put = black_scholes_greeks(self.S, self.K, self.T, self.r, 0.35, 'put')['price']
+        ivs = implied_volatility([call, put], self.S, self.K, self.T, self.r, ['call', 'put'])
+        np.testing.assert_allclose(ivs, [0.25, 0.35], atol=1e-4)
+
+        for bad in ('straddle', ['call', 'straddle'], [1, 0]):
+            with self.assertRaises(ValueError):
+                implied_volatility([call, put], self.S, self.K, self.T, self.r, bad)
+
     def test_edge_cases(self):
         """Test edge cases like expired options."""
         # Expired in-the-money call
@@ -43,5 +64,50 @@ class TestFinancialMath(unittest.TestCase):
         self.assertEqual(greeks['price'], 10) # Intrinsic value
         self.assertEqual(greeks['delta'], 1)
 
+    def test_black_scholes_vectorized(self):
+        """Test that the vectorized pricer matches the scalar one across a chain."""
+        strikes = np.array([90.0, 100.0, 110.0, 100.0])
+        expiries = np.array([0.5, 1.0, 0.25, 0.0])
+        is_call = np.array([True, False, True, False])
+        greeks = black_scholes_greeks_vec(self.S, strikes, expiries, self.r, self.sigma, is_call)
+        for i in range(len(strikes)):
+            expected = black_scholes_greeks(self.S, strikes[i], expiries[i], self.r, self.sigma,
+                                            'call' if is_call[i] else 'put')
+            for name, value in expected.items():
+                self.assertAlmostEqual(greeks[name][i], value, places=10)
+
+    def test_atm_table(self):
+        """Test that the ATM table reproduces at-the-money prices."""
+        T_days = np.array([7, 30, 365])
+        sigmas = np.array([0.1, 0.2, 0.4])
+        table = precompute_atm_table(T_days, sigmas, self.r)
+        self.assertEqual(table.shape, (3, 3, 5))
+        for ti, days in enumerate(T_days):
+            for si, sigma in enumerate(sigmas):
+                T = days / 365
+                _, _, Nd1, Nd2, _ = table[ti, si]
+                price = self.S * Nd1 - self.K * np.exp(-self.r * T) * Nd2
+                expected = black_scholes_greeks(self.S, self.K, T, self.r, sigma, 'call')
+                self.assertAlmostEqual(price, expected['price'], delta=1e-4)
+
+    def test_black_scholes_numba(self):
+        """Test the Numba kernels against the scipy reference implementation."""
+        names = ('price', 'delta', 'gamma', 'theta', 'vega', 'rho')
+        strikes = np.array([80.0, 95.0, 100.0, 105.0, 120.0])
+        for option_type in ('call', 'put'):
+            is_call = option_type == 'call'
+            for K in strikes:
+                expected = black_scholes_greeks(self.S, K, self.T, self.r, self.sigma, option_type)
+                result = bs_greeks_nb(float(self.S), K, self.T, self.r, self.sigma, is_call)
+                for name, value in zip(names, result):
+                    self.assertAlmostEqual(value, expected[name], delta=1e-4) # CDF approximation error scales with S
+
+        n = len(strikes)
+        batch = bs_greeks_nb_batch(np.full(n, float(self.S)), strikes, np.full(n, self.T),
+                                   np.full(n, self.r), np.full(n, self.sigma), np.ones(n, dtype=np.bool_))
+        for i, K in enumerate(strikes):
+            expected = black_scholes_greeks(self.S, K, self.T, self.r, self.sigma, 'call')
+            self.assertAlmostEqual(batch[i, 0], expected['price'], delta=1e-4)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+import numpy as np
+
+from risk_management import RiskManager
+
+class TestRiskManager(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a risk manager with the default VaR confidence level."""
+        self.rm = RiskManager({'risk': {'var_confidence_level': 0.95}}, portfolio=None)
+        self.rng = np.random.default_rng(7)
+
+    def test_var_matches_percentile(self):
+        """Test that the partition-based VaR matches np.percentile exactly."""
+        # Odd and even sample sizes; cl=0 and cl=0.001 put the upper index at n-1
+        for n in (50, 51, 99, 100, 1000, 1001):
+            returns = self.rng.standard_normal(n)
+            for cl in (0.0, 0.001, 0.5, 0.9, 0.95, 0.99, 1.0):
+                with self.subTest(n=n, cl=cl):
+                    expected = abs(np.percentile(returns, 100 * (1 - cl)))
+                    self.assertEqual(self.rm.calculate_var(returns, cl), expected)
+
+    def test_var_default_confidence_and_short_history(self):
+        """Test the configured confidence level and the short-history guard."""
+        returns = self.rng.standard_normal(200)
+        self.assertEqual(self.rm.calculate_var(returns), abs(np.percentile(returns, 100 * (1 - 0.95))))
+        self.assertEqual(self.rm.calculate_var(returns[:49]), 0)
+
+    def test_var_rejects_bad_confidence_level(self):
+        """Test that confidence levels outside [0, 1] raise like np.percentile."""
+        returns = self.rng.standard_normal(100)
+        for cl in (-0.1, 1.2):
+            with self.subTest(cl=cl):
+                with self.assertRaises(ValueError):
+                    self.rm.calculate_var(returns, cl)
+
+    def test_var_with_nan_returns(self):
+        """Test that NaN returns give a NaN VaR, as np.percentile does."""
+        returns = self.rng.standard_normal(100)
+        returns[10] = np.nan
+        self.assertTrue(np.isnan(np.percentile(returns, 5)))
+        self.assertTrue(np.isnan(self.rm.calculate_var(returns, 0.95)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+import numpy as np
+import pandas as pd
+import backtrader as bt
+import backtrader.indicators as btind
+
+from financial_math import black_scholes_greeks, black_scholes_greeks_vec
+from strategy_engine import BaseStrategy, IronCondorStrategy, RSIMomentumStrategy, StraddleStrategy, wilder_rsi
+
+def run_strategy(strategy_cls, close, **params):
+    """Runs a strategy over a preloaded 1-minute feed and returns the instance."""
+    close = np.asarray(close, dtype=np.float64)
+    df = pd.DataFrame(
+        {'open': close, 'high': close, 'low': close, 'close': close,
+         'volume': 0, 'openinterest': 0},
+        index=pd.date_range('2024-01-01', periods=len(close), freq='min'),
+    )
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.PandasData(dataname=df))
+    cerebro.addstrategy(strategy_cls, symbol_config={'lot_size': 25}, **params)
+    return cerebro.run()[0]
+
+class QuietStraddle(StraddleStrategy):
+    def log(self, txt, dt=None):
+        pass
+
+class TestStraddleStrategy(unittest.TestCase):
+
+    def assertMatchesPricer(self, strat, S, K):
+        T = strat.p.days_to_expiry / 365
+        expected = black_scholes_greeks_vec(S, K, T, strat.p.risk_free_rate, strat.p.volatility, [True, False])
+        call, put, delta = strat.straddle_quote(S, K)
+        for value in (call, put, delta):
+            self.assertIsInstance(value, np.float64)
+        self.assertAlmostEqual(call, expected['price'][0], delta=0.01)
+        self.assertAlmostEqual(put, expected['price'][1], delta=0.01)
+        self.assertAlmostEqual(delta, expected['delta'].sum(), delta=1e-3)
+
+    def test_atm_table_matches_pricer(self):
+        """Test that on-grid quotes from the table match the full pricer."""
+        strat = run_strategy(QuietStraddle, [25000.0] * 5, days_to_expiry=7, volatility=0.15)
+        self.assertMatchesPricer(strat, 25000.0, 25000.0)
+
+    def test_near_atm_strikes_match_pricer(self):
+        """Test strikes away from S inside and outside the ATM tolerance band."""
+        K = 25000.0
+        for days, sigma in ((1, 0.15), (7, 0.15), (30, 0.6), (365, 0.2)):
+            strat = run_strategy(QuietStraddle, [K] * 5, days_to_expiry=days, volatility=sigma)
+            band = strat.p.atm_tolerance * sigma * np.sqrt(days / 365)
+            for S in (K * np.exp(-0.9 * band), K * np.exp(0.9 * band), 25049.0, 25249.0, 24751.0):
+                with self.subTest(days=days, sigma=sigma, S=S):
+                    self.assertMatchesPricer(strat, S, K)
+
+    def test_off_grid_falls_back_to_pricer(self):
+        """Test that expiries and vols outside the table grid are priced exactly."""
+        cases = [
+            dict(days_to_expiry=0, volatility=0.15),
+            dict(days_to_expiry=7.9, volatility=0.15),
+            dict(days_to_expiry=400, volatility=0.15),
+            dict(days_to_expiry=7, volatility=1.5),
+            dict(days_to_expiry=7, volatility=0.0),
+            dict(days_to_expiry=7, volatility=0.999), # Past the top bucket
+        ]
+        for params in cases:
+            with self.subTest(**params):
+                strat = run_strategy(QuietStraddle, [25000.0] * 5, **params)
+                self.assertMatchesPricer(strat, 25000.0, 25000.0)
+
+        strat = run_strategy(QuietStraddle, [25000.0] * 5, days_to_expiry=0)
+        call, put, _ = strat.straddle_quote(25000.0, 25000.0)
+        self.assertEqual((call, put), (0.0, 0.0)) # Expired ATM options are worthless
+
+class QuietCondor(IronCondorStrategy):
+    def log(self, txt, dt=None):
+        pass
+
+class TestIronCondorStrategy(unittest.TestCase):
+
+    def test_condor_quote(self):
+        """Test the rounded strikes, signed quantities and net credit/delta."""
+        price = 25040.0
+        strat = run_strategy(QuietCondor, [price] * 5)
+        legs, net_credit, net_delta = strat.condor_quote(price)
+
+        # Sell put, buy put, sell call, buy call, rounded to the 50-point grid
+        np.testing.assert_array_equal(legs.strikes, [24550, 24300, 25550, 25800])
+        np.testing.assert_array_equal(legs.qty, [-25, 25, -25, 25])
+
+        T = strat.p.days_to_expiry / 365
+        expected_credit = expected_delta = 0.0
+        for K, is_call, qty in zip(legs.strikes, legs.is_call, legs.qty):
+            greeks = black_scholes_greeks(price, K, T, strat.p.risk_free_rate, strat.p.volatility,
+                                          'call' if is_call else 'put')
+            expected_credit -= qty * greeks['price']
+            expected_delta += qty * greeks['delta']
+        self.assertGreater(net_credit, 0) # Short legs are closer to the money
+        self.assertAlmostEqual(net_credit, expected_credit, places=8)
+        self.assertAlmostEqual(net_delta, expected_delta, places=8)
+
+class RSIProbe(BaseStrategy):
+    """Records backtrader's RSI for every bar it is defined on."""
+    def __init__(self):
+        super().__init__()
+        self.rsi = btind.RelativeStrengthIndex(period=14)
+        self.values = []
+
+    def next(self):
+        self.values.append((len(self.underlying) - 1, self.rsi[0]))
+
+class TestWilderRSI(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.close = 25000 + np.cumsum(rng.standard_normal(300) * 10)
+
+    def test_matches_backtrader_indicator(self):
+        """Test that the vectorized RSI matches btind.RelativeStrengthIndex bar for bar."""
+        rsi = wilder_rsi(self.close, 14)
+        probe = run_strategy(RSIProbe, self.close)
+        self.assertEqual(len(probe.values), len(self.close) - 14)
+        for i, value in probe.values:
+            self.assertAlmostEqual(rsi[i], value, places=8)
+
+    def test_warm_up_and_short_series(self):
+        """Test the NaN warm-up period and series too short for a single value."""
+        rsi = wilder_rsi(self.close, 14)
+        self.assertTrue(np.isnan(rsi[:14]).all())
+        self.assertFalse(np.isnan(rsi[14:]).any())
+
+        for n in (0, 1, 14):
+            short = wilder_rsi(self.close[:n], 14)
+            self.assertEqual(len(short), n)
+            self.assertTrue(np.isnan(short).all())
+        self.assertFalse(np.isnan(wilder_rsi(self.close[:15], 14)[-1]))
+
+    def test_strategy_uses_precomputed_rsi(self):
+        """Test that a preloaded run precomputes RSI over the whole series."""
+        class QuietRSI(RSIMomentumStrategy):
+            def log(self, txt, dt=None):
+                pass
+
+        strat = run_strategy(QuietRSI, self.close)
+        np.testing.assert_array_equal(strat._rsi_arr, wilder_rsi(self.close, 14))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,30 @@
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# backtrader stores datetimes as days since 0001-01-01 (proleptic Gregorian
+# ordinal); this is the value for the Unix epoch
+_BT_EPOCH_ORDINAL = 719163
+
+def _time_axis(strat, n):
+    """
+    Returns the timestamps of the last `n` bars of the strategy's data as a
+    datetime64 array, falling back to bar numbers if there aren't enough bars.
+    """
+    dt = np.asarray(strat.datas[0].datetime.array, dtype=np.float64)
+    if len(dt) < n:
+        return np.arange(n, dtype=np.int32)
+    seconds = np.round((dt[len(dt) - n:] - _BT_EPOCH_ORDINAL) * 86400)
+    return seconds.astype(np.int64).astype('datetime64[s]')
+
 def generate_backtest_report(cerebro, metrics, filename='backtest_report.html'):
     """
     Generates an interactive HTML report of the backtest results using Plotly.
     """
     strat = cerebro.runstrats[0][0]
-    portfolio_values = strat.analyzers.drawdown.get_analysis().portfolio
+    # Two decimals are plenty for the curves and keep the serialized report
+    # small. (float32 would be too coarse: its resolution is 1.0 at 1 crore.)
+    portfolio_values = np.round(np.asarray(strat.analyzers.drawdown.get_analysis().portfolio, dtype=np.float64), 2)
     
     # Create subplots
     fig = make_subplots(
@@ -18,16 +36,16 @@ def generate_backtest_report(cerebro, metrics, filename='backtest_report.html'):
 
     # 1. Equity Curve
     fig.add_trace(go.Scatter(
-        x=list(range(len(portfolio_values))),
+        x=_time_axis(strat, len(portfolio_values)),
         y=portfolio_values,
         mode='lines',
         name='Portfolio Value'
     ), row=1, col=1)
 
     # 2. Drawdown
-    drawdown_data = strat.analyzers.drawdown.get_analysis().drawdown
+    drawdown_data = np.round(np.asarray(strat.analyzers.drawdown.get_analysis().drawdown, dtype=np.float64), 2)
     fig.add_trace(go.Scatter(
-        x=list(range(len(drawdown_data))),
+        x=_time_axis(strat, len(drawdown_data)),
         y=drawdown_data,
         mode='lines',
         name='Drawdown (%)',
@@ -36,9 +54,11 @@ def generate_backtest_report(cerebro, metrics, filename='backtest_report.html'):
     ), row=1, col=2)
     
     # 3. Performance Metrics Table
+    metric_names = list(metrics.keys())
+    metric_values = [f'{v:.2f}' for v in metrics.values()]
     fig.add_trace(go.Table(
         header=dict(values=['Metric', 'Value']),
-        cells=dict(values=[list(metrics.keys()), [f'{v:.2f}' for v in metrics.values()]])
+        cells=dict(values=[metric_names, metric_values])
     ), row=2, col=2)
 
     # Update layout
@@ -48,4 +68,8 @@ def generate_backtest_report(cerebro, metrics, filename='backtest_report.html'):
         showlegend=False
     )
     
-    fig.write_html(filename)
+    # Load plotly.js from the CDN instead of embedding ~3.5 MB of it in every
+    # report, and write the page in a single call.
+    html = fig.to_html(full_html=True, include_plotlyjs='cdn', div_id='report')
+    with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(html)